@@ -3,20 +3,50 @@
 
 from __future__ import annotations
 
+import atexit
 import json
 import os
+import re
 import shlex
-import select
+import selectors
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, FrozenSet, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=True).encode("ascii")
+
+    _loads = json.loads
+
+
+_HOME = os.path.expanduser("~")
 
 
 def _expand_path(value: str) -> str:
-    return os.path.expandvars(os.path.expanduser(value))
+    # Most args are plain flags or absolute paths; only pay for expansion when needed.
+    if value.startswith("~"):
+        if value == "~" or value.startswith("~/"):
+            value = _HOME + value[1:]
+        else:
+            value = os.path.expanduser(value)  # ~otheruser/...
+    if "$" in value:
+        value = os.path.expandvars(value)
+    return value
 
 
 @dataclass
@@ -26,6 +56,8 @@ class ServerConfig:
     args: list[str]
     env: dict[str, str]
     server_type: str
+    # Opt out of process pooling, e.g. for servers holding per-session auth state.
+    no_share: bool = False
 
     @classmethod
     def from_dict(cls, name: str, payload: dict[str, Any]) -> "ServerConfig":
@@ -35,6 +67,7 @@ class ServerConfig:
             args=[_expand_path(str(x)) for x in payload.get("args", [])],
             env={k: str(v) for k, v in (payload.get("env") or {}).items()},
             server_type=str(payload.get("type", "stdio")),
+            no_share=bool(payload.get("noShare") or payload.get("no_share")),
         )
 
 
@@ -57,10 +90,9 @@ def load_mcp_servers(config_path: Path | None = None) -> dict[str, ServerConfig]
         )
 
     for path in candidates:
-        if not path.exists():
-            continue
+        # A missing candidate surfaces as FileNotFoundError here; no separate exists() stat.
         try:
-            payload = json.loads(path.read_text(encoding="utf-8"))
+            payload = _loads(path.read_bytes())
         except Exception:
             continue
 
@@ -85,6 +117,24 @@ def load_mcp_servers(config_path: Path | None = None) -> dict[str, ServerConfig]
     return {}
 
 
+_STDERR_TAIL_BYTES = 32 * 1024
+_CONTENT_LENGTH_RE = re.compile(rb"(?i)content-length:\s*(\d+)")
+
+_BASE_ENV: dict[str, str] | None = None
+
+
+def _base_env() -> dict[str, str]:
+    """Environment inherited by spawned servers.
+
+    Snapshotted from ``os.environ`` on the first spawn and shared afterwards, so
+    changes the caller makes to ``os.environ`` later are not picked up.
+    """
+    global _BASE_ENV
+    if _BASE_ENV is None:
+        _BASE_ENV = dict(os.environ)
+    return _BASE_ENV
+
+
 class McpClient:
     """Very small JSON-RPC over stdio client for MCP servers."""
 
@@ -93,15 +143,27 @@ class McpClient:
         self.timeout_s = timeout_s
         self.proc: subprocess.Popen[bytes] | None = None
         self._id = 0
+        # Frames are carved out of _rbuf starting at _rpos; consumed bytes are
+        # compacted away only once they make up more than half the buffer.
+        self._rbuf = bytearray()
+        self._rpos = 0
+        self._slab = memoryview(bytearray(65536))
+        self._sel: selectors.BaseSelector | None = None
+        self._stdin_fd: int | None = None
+        # Last few KiB of server stderr, kept for error messages.
+        self._stderr_tail = bytearray()
+        self._stderr_thread: threading.Thread | None = None
+        self._tools_cache: list[dict[str, Any]] | None = None
+        self._lowered_tools: dict[str, str] = {}
+        # JSON-RPC over one stdio pipe is not reentrant; pooled clients are shared across threads.
+        self._lock = threading.Lock()
 
     def __enter__(self) -> "McpClient":
-        env = os.environ.copy()
-        env.update(self.server.env)
         # Some MCP server builds write logs under XDG state paths.
         # Force a user-writable location to avoid permission failures.
         state_home = Path.home() / ".pm-automation" / "state"
         state_home.mkdir(parents=True, exist_ok=True)
-        env["XDG_STATE_HOME"] = str(state_home)
+        env = {**_base_env(), **self.server.env, "XDG_STATE_HOME": str(state_home)}
         if self.server.args:
             first_arg = self.server.args[0]
             arg_path = Path(first_arg)
@@ -117,10 +179,24 @@ class McpClient:
             stderr=subprocess.PIPE,
             env=env,
         )
+        assert self.proc.stdin
+        self._stdin_fd = self.proc.stdin.fileno()
+        # stderr must be drained continuously: a server that fills the pipe with
+        # logs would otherwise block on write and never answer on stdout.
+        self._stderr_thread = threading.Thread(target=self._drain_stderr, daemon=True)
+        self._stderr_thread.start()
+        # Register stdout once rather than rebuilding an fd set on every read.
+        self._sel = selectors.DefaultSelector()
+        self._sel.register(self.proc.stdout, selectors.EVENT_READ)
         self.initialize()
         return self
 
     def __exit__(self, exc_type, exc, tb) -> None:
+        self._tools_cache = None
+        self._lowered_tools = {}
+        if self._sel:
+            self._sel.close()
+            self._sel = None
         if not self.proc:
             return
         try:
@@ -129,73 +205,141 @@ class McpClient:
         except Exception:
             self.proc.kill()
 
+    def _drain_stderr(self) -> None:
+        assert self.proc and self.proc.stderr
+        fd = self.proc.stderr.fileno()
+        while True:
+            try:
+                chunk = os.read(fd, 4096)
+            except OSError:
+                return
+            if not chunk:
+                return
+            self._stderr_tail += chunk
+            if len(self._stderr_tail) > _STDERR_TAIL_BYTES:
+                del self._stderr_tail[:-_STDERR_TAIL_BYTES]
+
+    def _stderr_text(self) -> str:
+        if self._stderr_thread:
+            # The process is usually exiting here; let the drainer catch its last words.
+            self._stderr_thread.join(timeout=1)
+        return bytes(self._stderr_tail).decode("utf-8", errors="ignore").strip()
+
     def _write_message(self, payload: dict[str, Any]) -> None:
-        if not self.proc or not self.proc.stdin:
+        if not self.proc or self._stdin_fd is None:
             raise RuntimeError("MCP process is not running")
-        data = json.dumps(payload).encode("utf-8")
-        header = f"Content-Length: {len(data)}\r\n\r\n".encode("ascii")
-        self.proc.stdin.write(header + data)
-        self.proc.stdin.flush()
+        data = _dumps(payload)
+        header = b"Content-Length: %d\r\n\r\n" % len(data)
+        # Hand header and body to the kernel together; no joined copy, no userspace buffer.
+        views = [memoryview(header), memoryview(data)]
+        try:
+            while views:
+                sent = os.writev(self._stdin_fd, views)
+                while views and sent >= len(views[0]):
+                    sent -= len(views.pop(0))
+                if views:
+                    views[0] = views[0][sent:]
+        except BrokenPipeError:
+            err = self._stderr_text()
+            suffix = f" stderr: {err}" if err else ""
+            raise RuntimeError(f"MCP process exited before accepting input.{suffix}") from None
+
+    def _fill_buffer(self, deadline_ns: int, part: str) -> None:
+        """Append whatever stdout has ready (up to 64 KiB) to the read buffer."""
+        assert self.proc and self.proc.stdout and self._sel
+        remaining_ns = deadline_ns - time.monotonic_ns()
+        if remaining_ns <= 0:
+            raise RuntimeError(f"MCP read timeout after {self.timeout_s}s while reading {part}")
+        if not self._sel.select(remaining_ns / 1_000_000_000):
+            raise RuntimeError(f"MCP read timeout after {self.timeout_s}s while reading {part}")
+        count = os.readv(self.proc.stdout.fileno(), [self._slab])
+        if not count:
+            err = self._stderr_text()
+            suffix = f" stderr: {err}" if err else ""
+            raise RuntimeError(f"MCP stream closed while reading {part}.{suffix}")
+        self._rbuf += self._slab[:count]
 
     def _read_message(self) -> dict[str, Any]:
         if not self.proc or not self.proc.stdout:
             raise RuntimeError("MCP process is not running")
-        deadline = time.monotonic() + self.timeout_s
-        header = b""
-        while b"\r\n\r\n" not in header:
-            remaining = max(0.0, deadline - time.monotonic())
-            if remaining == 0.0:
-                raise RuntimeError(f"MCP read timeout after {self.timeout_s}s while reading header")
-            ready, _, _ = select.select([self.proc.stdout], [], [], remaining)
-            if not ready:
-                raise RuntimeError(f"MCP read timeout after {self.timeout_s}s while reading header")
-            chunk = self.proc.stdout.read(1)
-            if not chunk:
-                err = ""
-                if self.proc.stderr:
-                    try:
-                        err = self.proc.stderr.read().decode("utf-8", errors="ignore").strip()
-                    except Exception:
-                        err = ""
-                suffix = f" stderr: {err}" if err else ""
-                raise RuntimeError(f"MCP stream closed while reading header.{suffix}")
-            header += chunk
-        header_text = header.decode("ascii", errors="ignore")
-        length = None
-        for line in header_text.split("\r\n"):
-            if line.lower().startswith("content-length:"):
-                length = int(line.split(":", 1)[1].strip())
-                break
-        if length is None:
+        deadline_ns = time.monotonic_ns() + self.timeout_s * 1_000_000_000
+        # Bytes past the current frame stay in _rbuf for the next call.
+        header_end = self._rbuf.find(b"\r\n\r\n", self._rpos)
+        while header_end == -1:
+            self._fill_buffer(deadline_ns, "header")
+            header_end = self._rbuf.find(b"\r\n\r\n", self._rpos)
+        match = _CONTENT_LENGTH_RE.search(self._rbuf, self._rpos, header_end)
+        self._rpos = header_end + 4
+        if match is None:
             raise RuntimeError("Missing Content-Length header from MCP server")
-        body = b""
-        while len(body) < length:
-            remaining = max(0.0, deadline - time.monotonic())
-            if remaining == 0.0:
-                raise RuntimeError(f"MCP read timeout after {self.timeout_s}s while reading body")
-            ready, _, _ = select.select([self.proc.stdout], [], [], remaining)
-            if not ready:
-                raise RuntimeError(f"MCP read timeout after {self.timeout_s}s while reading body")
-            chunk = self.proc.stdout.read(length - len(body))
-            if not chunk:
-                raise RuntimeError("MCP stream closed while reading body")
-            body += chunk
-        return json.loads(body.decode("utf-8"))
+        length = int(match.group(1))
+        body_end = self._rpos + length
+        while len(self._rbuf) < body_end:
+            self._fill_buffer(deadline_ns, "body")
+        # Views must be released before _rbuf is resized again.
+        with memoryview(self._rbuf) as view, view[self._rpos : body_end] as body:
+            # orjson parses the view in place; stdlib json needs bytes.
+            msg = _loads(body) if orjson is not None else _loads(body.tobytes())
+        self._rpos = body_end
+        if self._rpos == len(self._rbuf):
+            self._rbuf.clear()
+            self._rpos = 0
+        elif self._rpos > len(self._rbuf) // 2:
+            del self._rbuf[: self._rpos]
+            self._rpos = 0
+        return msg
 
     def _request(self, method: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
-        self._id += 1
-        req = {"jsonrpc": "2.0", "id": self._id, "method": method, "params": params or {}}
-        self._write_message(req)
-        while True:
-            msg = self._read_message()
-            if "id" not in msg:
-                # Notification; ignore.
-                continue
-            if msg.get("id") != self._id:
-                continue
-            if "error" in msg:
-                raise RuntimeError(f"{method} failed: {msg['error']}")
-            return msg.get("result", {})
+        with self._lock:
+            self._id += 1
+            req = {"jsonrpc": "2.0", "id": self._id, "method": method, "params": params or {}}
+            self._write_message(req)
+            while True:
+                msg = self._read_message()
+                if "id" not in msg:
+                    # Notification; ignore.
+                    continue
+                if msg.get("id") != self._id:
+                    continue
+                if "error" in msg:
+                    raise RuntimeError(f"{method} failed: {msg['error']}")
+                return msg.get("result", {})
+
+    def batch(
+        self, calls: list[tuple[str, dict[str, Any] | None]], first_ok: bool = False
+    ) -> list[dict[str, Any] | Exception | None]:
+        """Pipeline several requests: write them all, then collect replies by id.
+
+        Results line up with ``calls``; a failed request yields a ``RuntimeError``.
+        With ``first_ok`` reading stops once the earliest successful call is known,
+        leaving later slots as ``None``; their stray replies are skipped by later reads.
+        """
+        results: list[dict[str, Any] | Exception | None] = [None] * len(calls)
+        with self._lock:
+            pending: dict[int, int] = {}
+            for idx, (method, params) in enumerate(calls):
+                self._id += 1
+                pending[self._id] = idx
+                self._write_message({"jsonrpc": "2.0", "id": self._id, "method": method, "params": params or {}})
+            done = [False] * len(calls)
+            while pending:
+                msg = self._read_message()
+                idx = pending.pop(msg.get("id"), None)
+                if idx is None:
+                    # Notification or a reply we no longer wait for.
+                    continue
+                if "error" in msg:
+                    results[idx] = RuntimeError(f"{calls[idx][0]} failed: {msg['error']}")
+                else:
+                    results[idx] = msg.get("result", {})
+                done[idx] = True
+                if first_ok:
+                    for slot, result in enumerate(results):
+                        if not done[slot]:
+                            break
+                        if not isinstance(result, Exception):
+                            return results
+        return results
 
     def initialize(self) -> None:
         self._request(
@@ -213,20 +357,118 @@ class McpClient:
             pass
 
     def list_tools(self) -> list[dict[str, Any]]:
-        result = self._request("tools/list", {})
-        return result.get("tools", [])
+        # The tool inventory is fixed for the life of the process, so ask once.
+        if self._tools_cache is None:
+            result = self._request("tools/list", {})
+            self._tools_cache = result.get("tools", [])
+            names = (t.get("name", "") for t in self._tools_cache)
+            self._lowered_tools = {name.lower(): name for name in names}
+        return self._tools_cache
+
+    def tools_by_lower(self) -> dict[str, str]:
+        """Tool names keyed by their lowercase form, in server order."""
+        self.list_tools()
+        return self._lowered_tools
 
     def call_tool(self, name: str, arguments: dict[str, Any] | None = None) -> dict[str, Any]:
         return self._request("tools/call", {"name": name, "arguments": arguments or {}})
 
 
+_PoolKey = Tuple[str, Tuple[str, ...], FrozenSet[Tuple[str, str]]]
+
+_POOL: dict[_PoolKey, McpClient] = {}
+_POOL_PENDING: dict[_PoolKey, threading.Event] = {}
+_POOL_LOCK = threading.Lock()
+
+
+def _pool_key(server: ServerConfig) -> _PoolKey:
+    # Keyed on what gets spawned, not on server.name: several configured names that
+    # launch the same binary share one process. Args keep their order; env does not.
+    return (server.command, tuple(server.args), frozenset(server.env.items()))
+
+
+def _spawn_client(server: ServerConfig) -> McpClient:
+    client = McpClient(server)
+    try:
+        client.__enter__()
+    except BaseException:
+        # Reap a half-started process (and its stderr drainer) before giving up.
+        client.__exit__(None, None, None)
+        raise
+    return client
+
+
+def get_pooled_client(server: ServerConfig) -> McpClient:
+    """Return a live, initialized client for ``server``, spawning it at most once.
+
+    Concurrent callers asking for the same config wait on the in-flight
+    handshake instead of spawning duplicate processes. Servers marked
+    ``no_share`` always get a fresh client, which ``release`` terminates.
+    """
+    if server.no_share:
+        return _spawn_client(server)
+    key = _pool_key(server)
+    while True:
+        with _POOL_LOCK:
+            client = _POOL.get(key)
+            if client is not None and client.proc and client.proc.poll() is None:
+                return client
+            if client is not None:
+                # Process died since last use; drop it and respawn below.
+                del _POOL[key]
+                client.__exit__(None, None, None)
+            pending = _POOL_PENDING.get(key)
+            if pending is None:
+                pending = threading.Event()
+                _POOL_PENDING[key] = pending
+                break
+        pending.wait()
+
+    try:
+        client = _spawn_client(server)
+    except BaseException:
+        with _POOL_LOCK:
+            del _POOL_PENDING[key]
+        pending.set()
+        raise
+    with _POOL_LOCK:
+        _POOL[key] = client
+        del _POOL_PENDING[key]
+    pending.set()
+    return client
+
+
+def release(client: McpClient) -> None:
+    """Give back a client from ``get_pooled_client``.
+
+    Shared clients are not counted: this is a no-op for them, and their process
+    stays warm in the pool until ``shutdown_pool``. ``no_share`` clients are
+    terminated here.
+    """
+    if client.server.no_share:
+        client.__exit__(None, None, None)
+
+
+def shutdown_pool() -> None:
+    """Terminate every pooled MCP process."""
+    with _POOL_LOCK:
+        clients = list(_POOL.values())
+        _POOL.clear()
+    for client in clients:
+        client.__exit__(None, None, None)
+
+
+atexit.register(shutdown_pool)
+
+
 def _parse_text_content(call_result: dict[str, Any]) -> str:
     content = call_result.get("content", [])
     parts: list[str] = []
     for item in content:
         if isinstance(item, dict):
-            if "text" in item and item["text"] is not None:
-                parts.append(str(item["text"]))
+            text = item.get("text")
+            if text is not None:
+                parts.append(text if isinstance(text, str) else str(text))
             elif "json" in item:
                 parts.append(json.dumps(item["json"]))
     return "\n".join(parts).strip()
@@ -237,66 +479,96 @@ def _safe_json_from_result(call_result: dict[str, Any]) -> dict[str, Any]:
     if not text:
         return {}
     try:
-        return json.loads(text)
-    except json.JSONDecodeError:
+        return _loads(text)
+    except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses this
         # Keep raw text when a server returns plain text.
         return {"raw_text": text}
 
 
-def _best_tool_name(tools: list[dict[str, Any]], preferences: list[str]) -> str | None:
-    available = [t.get("name", "") for t in tools]
-    lowered = {name.lower(): name for name in available}
+_TOOL_PREFS: dict[str, tuple[str, ...]] = {
+    "slack": ("slack_read_api_call", "search_messages", "list_channels"),
+    "google": ("google_drive_search", "drive_search", "google_docs_search"),
+    "salesforce": ("salesforce_query", "soql_query", "opportunity_list"),
+    "glean": ("glean_read_api_call", "search", "search_documents"),
+}
+
+
+def _best_tool_name(tools_by_lower: dict[str, str], preferences: tuple[str, ...]) -> str | None:
     for pref in preferences:
-        if pref.lower() in lowered:
-            return lowered[pref.lower()]
-    for name in available:
-        lname = name.lower()
+        name = tools_by_lower.get(pref.lower())
+        if name is not None:
+            return name
+    for lname, name in tools_by_lower.items():
         if "search" in lname or "list" in lname or "query" in lname:
             return name
-    return available[0] if available else None
+    return next(iter(tools_by_lower.values()), None)
 
 
 def _call_with_attempts(client: McpClient, tool_name: str, arg_options: list[dict[str, Any]]) -> dict[str, Any]:
+    # All argument shapes go out in one pipelined batch; the first accepted one wins.
+    results = client.batch(
+        [("tools/call", {"name": tool_name, "arguments": args}) for args in arg_options], first_ok=True
+    )
     last_error = None
-    for args in arg_options:
-        try:
-            return client.call_tool(tool_name, args)
-        except Exception as exc:
-            last_error = exc
+    for result in results:
+        if isinstance(result, Exception):
+            last_error = result
             continue
+        if result is not None:
+            return result
     if last_error:
         raise RuntimeError(str(last_error))
     raise RuntimeError("No tool call attempts were made")
 
 
+def _args_from_schema(tool: dict[str, Any], query: str, lookback_days: int) -> dict[str, Any] | None:
+    """Build call arguments from the tool's advertised inputSchema.
+
+    Returns ``None`` when the tool publishes no schema, so the caller can fall back
+    to trying argument shapes.
+    """
+    properties = (tool.get("inputSchema") or {}).get("properties")
+    if not isinstance(properties, dict):
+        return None
+    args: dict[str, Any] = {}
+    query_key = next((k for k in ("query", "q") if k in properties), None)
+    if query_key:
+        args[query_key] = query
+    days_key = next((k for k in ("lookback_days", "days") if k in properties), None)
+    if days_key:
+        args[days_key] = lookback_days
+    return args
+
+
 def fetch_source_data(server_cfg: ServerConfig, source: str, lookback_days: int, customer_name: str = "") -> dict[str, Any]:
-    with McpClient(server_cfg) as client:
+    client = get_pooled_client(server_cfg)
+    try:
         tools = client.list_tools()
         if not tools:
             return {"error": f"No tools exposed by {server_cfg.name}"}
 
-        preferences = {
-            "slack": ["slack_read_api_call", "search_messages", "list_channels"],
-            "google": ["google_drive_search", "drive_search", "google_docs_search"],
-            "salesforce": ["salesforce_query", "soql_query", "opportunity_list"],
-            "glean": ["glean_read_api_call", "search", "search_documents"],
-        }.get(source, [])
+        preferences = _TOOL_PREFS.get(source, ())
 
-        selected = _best_tool_name(tools, preferences)
+        selected = _best_tool_name(client.tools_by_lower(), preferences)
         if not selected:
             return {"error": f"No usable tool for {source}"}
 
         customer_query = f"{customer_name} weekly project status updates".strip() if customer_name else "weekly project status updates"
-        call_result = _call_with_attempts(
-            client,
-            selected,
-            [
-                {"query": customer_query, "lookback_days": lookback_days},
-                {"q": customer_query, "days": lookback_days},
-                {"lookback_days": lookback_days},
-                {},
-            ],
-        )
+        tool = next((t for t in tools if t.get("name") == selected), {})
+        args = _args_from_schema(tool, customer_query, lookback_days)
+        if args is not None:
+            call_result = client.call_tool(selected, args)
+        else:
+            call_result = _call_with_attempts(
+                client,
+                selected,
+                [
+                    {"query": customer_query, "lookback_days": lookback_days},
+                    {"q": customer_query, "days": lookback_days},
+                    {"lookback_days": lookback_days},
+                    {},
+                ],
+            )
         parsed = _safe_json_from_result(call_result)
         return {
             "fetched_via": server_cfg.name,
@@ -304,25 +576,66 @@ def fetch_source_data(server_cfg: ServerConfig, source: str, lookback_days: int,
             "fetched_at": dt_now_iso(),
             "data": parsed,
         }
+    finally:
+        release(client)
+
+
+def fetch_many(
+    cfgs: dict[str, ServerConfig], sources: list[tuple[str, str, int]], customer_name: str = ""
+) -> dict[str, dict[str, Any] | Exception]:
+    """Fetch several sources concurrently.
+
+    ``sources`` holds ``(server_name, source, lookback_days)`` tuples. The result maps
+    each source to its payload, or to the exception raised while fetching it.
+    """
+    results: dict[str, dict[str, Any] | Exception] = {}
+    if not sources:
+        return results
+    with ThreadPoolExecutor(max_workers=min(8, len(sources))) as pool:
+        futures = {
+            pool.submit(fetch_source_data, cfgs[server_name], source, lookback_days, customer_name): source
+            for server_name, source, lookback_days in sources
+        }
+        for future in as_completed(futures):
+            source = futures[future]
+            try:
+                results[source] = future.result()
+            except Exception as exc:
+                results[source] = exc
+    return results
 
 
 def dt_now_iso() -> str:
-    import datetime as dt
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
-    return dt.datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+
+def load_json(path: Path) -> Any:
+    # Both decoders take the raw bytes, skipping a text-mode decode pass.
+    return _loads(path.read_bytes())
 
 
 def save_json(path: Path, payload: dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        return
+    # json.dump streams iterencode() chunks to the file instead of building one big str.
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
 
 
 def print_server_summary(servers: dict[str, ServerConfig]) -> None:
     if not servers:
         print("No MCP servers discovered from local config.")
         return
-    print("Discovered MCP servers:")
+    lines = ["Discovered MCP servers:"]
+    shared: dict[_PoolKey, list[str]] = {}
     for name, cfg in servers.items():
         cmd = " ".join(shlex.quote(x) for x in [cfg.command, *cfg.args])
-        print(f"- {name}: {cmd}")
-
+        lines.append(f"- {name}: {cmd}")
+        if not cfg.no_share:
+            shared.setdefault(_pool_key(cfg), []).append(name)
+    for names in shared.values():
+        if len(names) > 1:
+            lines.append(f"  note: {', '.join(names)} share one pooled MCP process")
+    sys.stdout.write("\n".join(lines) + "\n")
@@ -6,17 +6,59 @@ from __future__ import annotations
 import argparse
 import datetime as dt
 import html
-import json
+import io
+import os
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Any
-from mcp_live_fetch import load_mcp_servers, fetch_source_data, save_json, print_server_summary
+from typing import Any, Callable, Dict, List, Tuple, Union
+from mcp_live_fetch import load_json, load_mcp_servers, fetch_many, save_json, print_server_summary
+
+
+# path -> ((st_mtime_ns, st_size), parsed payload). Callers must not mutate cached payloads.
+_JSON_CACHE: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+
+_PRIO = {"Critical": 3, "High": 2, "Medium": 1, "Low": 0}
+
+
+@dataclass
+class Item:
+    """One normalized report row, whatever source it came from."""
+
+    # Declared by hand rather than with dataclass(slots=True), which needs Python 3.10.
+    __slots__ = ("source", "title", "owner", "status", "impact", "detail", "action", "weight")
+
+    source: str
+    title: str
+    owner: str
+    status: str
+    impact: str
+    detail: str
+    action: str
+
+    def __post_init__(self) -> None:
+        # Sort key derived from impact once, so sorting never calls back into Python.
+        # A plain slot, not a dataclass field, so it stays out of __init__/repr/eq.
+        self.weight: int = _PRIO.get(self.impact, 1)
 
 
 def read_json(path: Path, fallback: dict[str, Any]) -> dict[str, Any]:
-    if not path.exists():
+    try:
+        st = path.stat()
+    except FileNotFoundError:
         return fallback
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    key = (st.st_mtime_ns, st.st_size)
+    hit = _JSON_CACHE.get(path)
+    if hit is not None and hit[0] == key:
+        return hit[1]
+    payload = load_json(path)
+    _JSON_CACHE[path] = (key, payload)
+    return payload
 
 
 def _read_text_file(path: Path) -> str:
@@ -25,10 +67,20 @@ def _read_text_file(path: Path) -> str:
     return path.read_text(encoding="utf-8").strip()
 
 
+_DASH_RUN = re.compile(r"-+")
+# ASCII letters lowercased, digits kept, everything else mapped to "-".
+_SLUG_TABLE = str.maketrans({c: c.lower() if c.isalnum() else "-" for c in map(chr, range(128))})
+
+
+@lru_cache(maxsize=256)
 def _slugify(value: str) -> str:
-    cleaned = "".join(ch.lower() if ch.isalnum() else "-" for ch in value.strip())
-    while "--" in cleaned:
-        cleaned = cleaned.replace("--", "-")
+    value = value.strip()
+    if value.isascii():
+        cleaned = value.translate(_SLUG_TABLE)
+    else:
+        # Non-ASCII names keep full Unicode isalnum()/lower() semantics.
+        cleaned = "".join(ch.lower() if ch.isalnum() else "-" for ch in value)
+    cleaned = _DASH_RUN.sub("-", cleaned)
     return cleaned.strip("-") or "customer"
 
 
@@ -71,178 +123,236 @@ def _raw_to_documents(raw: dict[str, Any], source_name: str) -> list[dict[str, s
     ]
 
 
-def normalize_slack(payload: dict[str, Any]) -> list[dict[str, str]]:
-    payload = _extract_data(payload)
-    if "raw_text" in payload and "messages" not in payload:
-        payload = {"messages": _raw_to_messages(payload)}
-    items = []
-    for msg in payload.get("messages", []):
-        items.append(
-            {
-                "source": "Slack",
-                "title": msg.get("title", "Channel update"),
-                "owner": msg.get("owner", "Unknown"),
-                "status": msg.get("status", "update"),
-                "impact": msg.get("impact", "Medium"),
-                "detail": msg.get("detail", ""),
-                "action": msg.get("action", ""),
-            }
-        )
-    return items
+def _raw_to_opportunities(raw: dict[str, Any]) -> list[dict[str, str]]:
+    return [
+        {
+            "account": "Salesforce extract",
+            "name": "Pipeline signal",
+            "owner": "Salesforce MCP",
+            "stage": "Unknown",
+            "risk": "Medium",
+            "detail": raw["raw_text"][:800],
+            "next_step": "",
+        }
+    ]
 
 
-def normalize_salesforce(payload: dict[str, Any]) -> list[dict[str, str]]:
-    payload = _extract_data(payload)
-    if "raw_text" in payload and "opportunities" not in payload:
-        payload = {
-            "opportunities": [
-                {
-                    "account": "Salesforce extract",
-                    "name": "Pipeline signal",
-                    "owner": "Salesforce MCP",
-                    "stage": "Unknown",
-                    "risk": "Medium",
-                    "detail": payload["raw_text"][:800],
-                    "next_step": "",
-                }
-            ]
+def _raw_to_insights(raw: dict[str, Any]) -> list[dict[str, str]]:
+    return [
+        {
+            "topic": "Glean weekly search signal",
+            "owner": "Glean MCP",
+            "state": "info",
+            "priority": "Medium",
+            "summary": raw["raw_text"][:800],
+            "follow_up": "",
         }
-    items = []
-    for opp in payload.get("opportunities", []):
-        items.append(
-            {
-                "source": "Salesforce",
-                "title": f"{opp.get('account', 'Account')} - {opp.get('name', 'Opportunity')}",
-                "owner": opp.get("owner", "Unknown"),
-                "status": opp.get("stage", "Unknown"),
-                "impact": opp.get("risk", "Medium"),
-                "detail": opp.get("detail", ""),
-                "action": opp.get("next_step", ""),
-            }
-        )
-    return items
+    ]
 
 
-def normalize_gdrive(payload: dict[str, Any]) -> list[dict[str, str]]:
+def _opportunity_title(opp: dict[str, Any]) -> str:
+    return f"{opp.get('account', 'Account')} - {opp.get('name', 'Opportunity')}"
+
+
+_RawWrapper = Callable[[Dict[str, Any]], List[Dict[str, str]]]
+# Output field -> (input key, default), or a callable for derived fields.
+_FieldMap = Dict[str, Union[Tuple[str, str], Callable[[Dict[str, Any]], str]]]
+# (source label, list key, raw_text wrapper, field map) per input file.
+_NormalizeSpec = Tuple[str, str, _RawWrapper, _FieldMap]
+
+_SLACK_SPEC: _NormalizeSpec = (
+    "Slack",
+    "messages",
+    _raw_to_messages,
+    {
+        "title": ("title", "Channel update"),
+        "owner": ("owner", "Unknown"),
+        "status": ("status", "update"),
+        "impact": ("impact", "Medium"),
+        "detail": ("detail", ""),
+        "action": ("action", ""),
+    },
+)
+_SALESFORCE_SPEC: _NormalizeSpec = (
+    "Salesforce",
+    "opportunities",
+    _raw_to_opportunities,
+    {
+        "title": _opportunity_title,
+        "owner": ("owner", "Unknown"),
+        "status": ("stage", "Unknown"),
+        "impact": ("risk", "Medium"),
+        "detail": ("detail", ""),
+        "action": ("next_step", ""),
+    },
+)
+_GDRIVE_SPEC: _NormalizeSpec = (
+    "GDrive",
+    "documents",
+    lambda raw: _raw_to_documents(raw, "Google Drive"),
+    {
+        "title": ("title", "Document update"),
+        "owner": ("owner", "Unknown"),
+        "status": ("state", "updated"),
+        "impact": ("priority", "Medium"),
+        "detail": ("summary", ""),
+        "action": ("required_action", ""),
+    },
+)
+_GLEAN_SPEC: _NormalizeSpec = (
+    "Glean",
+    "insights",
+    _raw_to_insights,
+    {
+        "title": ("topic", "Knowledge signal"),
+        "owner": ("owner", "Unknown"),
+        "status": ("state", "info"),
+        "impact": ("priority", "Medium"),
+        "detail": ("summary", ""),
+        "action": ("follow_up", ""),
+    },
+)
+
+
+def _normalize(
+    payload: dict[str, Any],
+    source: str,
+    list_key: str,
+    raw_wrapper: _RawWrapper,
+    field_map: _FieldMap,
+) -> list[Item]:
     payload = _extract_data(payload)
-    if "raw_text" in payload and "documents" not in payload:
-        payload = {"documents": _raw_to_documents(payload, "Google Drive")}
-    items = []
-    for doc in payload.get("documents", []):
-        items.append(
-            {
-                "source": "GDrive",
-                "title": doc.get("title", "Document update"),
-                "owner": doc.get("owner", "Unknown"),
-                "status": doc.get("state", "updated"),
-                "impact": doc.get("priority", "Medium"),
-                "detail": doc.get("summary", ""),
-                "action": doc.get("required_action", ""),
-            }
-        )
-    return items
+    if "raw_text" in payload and list_key not in payload:
+        payload = {list_key: raw_wrapper(payload)}
+    return [
+        Item(source, **{out: (spec(rec) if callable(spec) else rec.get(*spec)) for out, spec in field_map.items()})
+        for rec in payload.get(list_key, ())
+    ]
 
 
-def normalize_glean(payload: dict[str, Any]) -> list[dict[str, str]]:
-    payload = _extract_data(payload)
-    if "raw_text" in payload and "insights" not in payload:
-        payload = {
-            "insights": [
-                {
-                    "topic": "Glean weekly search signal",
-                    "owner": "Glean MCP",
-                    "state": "info",
-                    "priority": "Medium",
-                    "summary": payload["raw_text"][:800],
-                    "follow_up": "",
-                }
-            ]
-        }
-    items = []
-    for insight in payload.get("insights", []):
-        items.append(
-            {
-                "source": "Glean",
-                "title": insight.get("topic", "Knowledge signal"),
-                "owner": insight.get("owner", "Unknown"),
-                "status": insight.get("state", "info"),
-                "impact": insight.get("priority", "Medium"),
-                "detail": insight.get("summary", ""),
-                "action": insight.get("follow_up", ""),
-            }
-        )
-    return items
+def normalize_slack(payload: dict[str, Any]) -> list[Item]:
+    return _normalize(payload, *_SLACK_SPEC)
 
 
+def normalize_salesforce(payload: dict[str, Any]) -> list[Item]:
+    return _normalize(payload, *_SALESFORCE_SPEC)
+
+
+def normalize_gdrive(payload: dict[str, Any]) -> list[Item]:
+    return _normalize(payload, *_GDRIVE_SPEC)
+
+
+def normalize_glean(payload: dict[str, Any]) -> list[Item]:
+    return _normalize(payload, *_GLEAN_SPEC)
+
+
+@lru_cache(maxsize=16)
 def priority_weight(priority: str) -> int:
-    rank = {"Critical": 3, "High": 2, "Medium": 1, "Low": 0}
-    return rank.get(priority, 1)
-
-
-def generate_markdown(items: list[dict[str, str]], report_date: str) -> str:
-    top_risks = [i for i in items if i["impact"] in {"Critical", "High"}][:5]
-    completed = [i for i in items if i["status"].lower() in {"closed", "done", "completed"}][:5]
-    in_flight = [i for i in items if i["status"].lower() not in {"closed", "done", "completed"}][:8]
-
-    lines = [
-        f"# PM Weekly Report ({report_date})",
-        "",
-        "## Executive Snapshot",
-        f"- Total updates captured: **{len(items)}**",
-        f"- Critical/High priority items: **{len([i for i in items if i['impact'] in {'Critical', 'High'}])}**",
-        f"- Sources: **{', '.join(sorted({i['source'] for i in items}))}**",
-        "",
-        "## Top Risks",
-    ]
+    return _PRIO.get(priority, 1)
+
+
+_CRIT_HIGH = frozenset({"Critical", "High"})
+_DONE_STATES = frozenset({"done", "completed", "closed"})
+_BLOCKED = frozenset({"blocked"})
+_NOT_STARTED = frozenset({"not started", "todo"})
+
+
+@dataclass
+class _Buckets:
+    """Items grouped for the report sections, capped at what the reports display."""
+
+    risks: list[Item] = field(default_factory=list)
+    completed: list[Item] = field(default_factory=list)
+    in_flight: list[Item] = field(default_factory=list)
+    actions: list[Item] = field(default_factory=list)
+    high_count: int = 0
+    sources: list[str] = field(default_factory=list)
+
+
+def _classify_items(items: list[Item], sources: list[str] | None = None) -> _Buckets:
+    """Bucket items for every report in one pass, so the generators never rescan them."""
+    buckets = _Buckets(sources=sorted({i.source for i in items}) if sources is None else sources)
+    risks, completed, in_flight, actions = buckets.risks, buckets.completed, buckets.in_flight, buckets.actions
+    high_count = 0
+    for item in items:
+        if item.impact in _CRIT_HIGH:
+            high_count += 1
+            if len(risks) < 10:
+                risks.append(item)
+        if item.status.lower() in _DONE_STATES:
+            if len(completed) < 5:
+                completed.append(item)
+        elif len(in_flight) < 8:
+            in_flight.append(item)
+        if item.action:
+            actions.append(item)
+    buckets.high_count = high_count
+    return buckets
+
+
+def generate_markdown(items: list[Item], report_date: str, buckets: _Buckets | None = None) -> str:
+    if buckets is None:
+        buckets = _classify_items(items)
+    top_risks = buckets.risks[:5]
+
+    buf = io.StringIO()
+    w = buf.write
+    w(f"# PM Weekly Report ({report_date})\n\n## Executive Snapshot\n")
+    w(f"- Total updates captured: **{len(items)}**\n")
+    w(f"- Critical/High priority items: **{buckets.high_count}**\n")
+    w(f"- Sources: **{', '.join(buckets.sources)}**\n")
+
+    w("\n## Top Risks\n")
     if not top_risks:
-        lines.append("- No high-severity risks identified.")
+        w("- No high-severity risks identified.\n")
     else:
         for item in top_risks:
-            lines.append(
-                f"- **[{item['source']}] {item['title']}** ({item['owner']}) - {item['detail']} | Next: {item['action'] or 'TBD'}"
+            w(
+                f"- **[{item.source}] {item.title}** ({item.owner}) - {item.detail} | Next: {item.action or 'TBD'}\n"
             )
 
-    lines.extend(["", "## Progress Highlights"])
-    if not completed:
-        lines.append("- No completed items reported this cycle.")
+    w("\n## Progress Highlights\n")
+    if not buckets.completed:
+        w("- No completed items reported this cycle.\n")
     else:
-        for item in completed:
-            lines.append(f"- **[{item['source']}] {item['title']}** - {item['detail']}")
+        for item in buckets.completed:
+            w(f"- **[{item.source}] {item.title}** - {item.detail}\n")
 
-    lines.extend(["", "## In-Flight Work"])
-    for item in in_flight:
-        lines.append(
-            f"- **[{item['source']}] {item['title']}** ({item['status']}, {item['impact']}) - {item['detail']} | Owner: {item['owner']}"
+    w("\n## In-Flight Work\n")
+    for item in buckets.in_flight:
+        w(
+            f"- **[{item.source}] {item.title}** ({item.status}, {item.impact}) - {item.detail} | Owner: {item.owner}\n"
         )
 
-    lines.extend(["", "## Action Register"])
-    for item in items:
-        if item["action"]:
-            lines.append(f"- {item['title']}: {item['action']}")
+    w("\n## Action Register\n")
+    buf.writelines(f"- {item.title}: {item.action}\n" for item in buckets.actions)
 
-    return "\n".join(lines) + "\n"
+    return buf.getvalue()
 
 
-def generate_html(items: list[dict[str, str]], report_date: str) -> str:
-    rows = []
-    for item in items:
-        rows.append(
-            "<tr>"
-            f"<td>{html.escape(item['source'])}</td>"
-            f"<td>{html.escape(item['title'])}</td>"
-            f"<td>{html.escape(item['owner'])}</td>"
-            f"<td>{html.escape(item['status'])}</td>"
-            f"<td>{html.escape(item['impact'])}</td>"
-            f"<td>{html.escape(item['detail'])}</td>"
-            f"<td>{html.escape(item['action'])}</td>"
-            "</tr>"
+_ROW_TMPL = "<tr><td>{}</td><td>{}</td><td>{}</td><td>{}</td><td>{}</td><td>{}</td><td>{}</td></tr>"
+
+
+def generate_html(items: list[Item], report_date: str) -> str:
+    _esc = html.escape
+    rows_html = "".join(
+        _ROW_TMPL.format(
+            _esc(i.source),
+            _esc(i.title),
+            _esc(i.owner),
+            _esc(i.status),
+            _esc(i.impact),
+            _esc(i.detail),
+            _esc(i.action),
         )
+        for i in items
+    )
 
     return f"""<!doctype html>
 <html>
 <head>
   <meta charset="utf-8" />
-  <title>PM Report {html.escape(report_date)}</title>
+  <title>PM Report {_esc(report_date)}</title>
   <style>
     body {{ font-family: Arial, sans-serif; margin: 24px; color: #222; }}
     h1 {{ margin-bottom: 8px; }}
@@ -254,7 +364,7 @@ def generate_html(items: list[dict[str, str]], report_date: str) -> str:
 </head>
 <body>
   <h1>PM Weekly Report</h1>
-  <div class="meta">Generated: {html.escape(report_date)} | Records: {len(items)}</div>
+  <div class="meta">Generated: {_esc(report_date)} | Records: {len(items)}</div>
   <table>
     <thead>
       <tr>
@@ -262,7 +372,7 @@ def generate_html(items: list[dict[str, str]], report_date: str) -> str:
       </tr>
     </thead>
     <tbody>
-      {''.join(rows)}
+      {rows_html}
     </tbody>
   </table>
 </body>
@@ -270,9 +380,9 @@ def generate_html(items: list[dict[str, str]], report_date: str) -> str:
 """
 
 
-def _status_rag_from_items(items: list[dict[str, str]]) -> tuple[str, str, str, str]:
-    has_critical = any(i["impact"] == "Critical" for i in items)
-    has_high = any(i["impact"] == "High" for i in items)
+def _status_rag_from_items(items: list[Item]) -> tuple[str, str, str, str]:
+    has_critical = any(i.impact == "Critical" for i in items)
+    has_high = any(i.impact == "High" for i in items)
     overall = "Red" if has_critical else ("Amber" if has_high else "Green")
     scope = "Amber" if has_high else "Green"
     schedule = "Amber" if has_high else "Green"
@@ -282,169 +392,260 @@ def _status_rag_from_items(items: list[dict[str, str]]) -> tuple[str, str, str,
 
 def _status_bucket(status: str, impact: str) -> str:
     s = status.lower()
-    if s in {"done", "completed", "closed"}:
+    if s in _DONE_STATES:
         return "Complete"
-    if s in {"blocked"}:
+    if s in _BLOCKED:
         return "Blocked"
-    if impact in {"Critical", "High"}:
+    if impact in _CRIT_HIGH:
         return "At Risk"
-    if s in {"not started", "todo"}:
+    if s in _NOT_STARTED:
         return "Not Started"
     return "In Progress"
 
 
-def generate_ventia_markdown(
-    items: list[dict[str, str]], report_date: str, period_label: str, customer_name: str, engagement_name: str
-) -> str:
+_VENTIA_AGENDA = (
+    "Teams",
+    "Status Updates / Issues, risks",
+    "High Level Plan",
+    "Resource Plan",
+    "Key Points to Discuss",
+)
+_VENTIA_PARTNER_TEAM = "Databricks / Partner: RSA, Senior PM, Delivery Engineers, Account Team"
+_VENTIA_ACTION_HEADER = ("S. No.", "Date", "Description", "Owner", "Status", "Comments")
+_VENTIA_NO_ACTION_ROWS = (("1", "-", "No actions captured", "-", "-", "-"),)
+_VENTIA_MILESTONE_HEADER = ("Item", "Status", "Target Date")
+_VENTIA_MILESTONES = ("Discovery & Design Alignment", "Build / Validation Stream", "Reporting & Handover")
+_VENTIA_LEGEND = ("Legend:", "Complete | In Progress | At Risk | Blocked | Not Started")
+_VENTIA_RISK_HEADER = ("ID", "Type", "Description", "Impact", "Probability", "Action(s) - Owner", "Status")
+_VENTIA_NO_RISK_ROWS = (
+    ("01", "Risk", "No high-severity risks captured", "Low", "Low", "Continue monitoring - PM", "Open"),
+)
+_VENTIA_PLAN_HEADER = ("Item", "Current Status", "Notes")
+_VENTIA_PLAN_ITEMS = (
+    ("Requirements & Design", "Design decisions and stakeholder approvals in progress."),
+    ("Build & Validation", "Weekly execution and quality checks across workstreams."),
+    ("Readout & Handover", "PM reporting cadence and governance updates."),
+)
+_VENTIA_RESOURCE_HEADER = ("Name", "Role", "Hours", "19/1", "26/1", "2/2", "9/2", "16/2", "23/2")
+_VENTIA_RESOURCE_ROWS = (
+    ("Delivery Lead", "Project Delivery", "128", "16", "16", "16", "16", "16", "16"),
+    ("Data Engineer", "Engineering", "240", "40", "40", "40", "40", "40", "40"),
+    ("PM", "Project Management", "64", "8", "8", "8", "8", "8", "8"),
+    ("RSA", "Architecture / Advisory", "32", "8", "8", "8", "8", "-", "-"),
+)
+# Hours and weekly allocation columns are right-aligned.
+_VENTIA_RESOURCE_NUMERIC = frozenset(range(2, 9))
+_VENTIA_DISCUSSION_POINTS = (
+    "Confirm acceptance criteria and sign-off windows.",
+    "Confirm dependency closure dates and owners.",
+    "Confirm next-week priorities and stakeholder readiness.",
+)
+
+# A line of text, or a (bold label, text) pair such as ("Scope:", "Green").
+_Line = Union[str, Tuple[str, str]]
+# (kind, value) where kind is h1/h2/h3 (str), label (str, bold line), para (_Line),
+# bullets (sequence of _Line) or table ((header, rows, right-aligned column indexes)).
+_Section = Tuple[str, Any]
+
+# Kinds that sit directly on top of the next block, with no blank line in between.
+_STICKY_KINDS = frozenset({"h1", "h2", "h3", "label"})
+_MD_HEADING = {"h1": "# ", "h2": "## ", "h3": "### "}
+
+
+def _build_ventia_sections(
+    items: list[Item],
+    report_date: str,
+    period_label: str,
+    customer_name: str,
+    engagement_name: str,
+    buckets: _Buckets | None = None,
+) -> list[_Section]:
+    """Structured content of the Ventia report, shared by the markdown and HTML renderers."""
+    if buckets is None:
+        buckets = _classify_items(items)
     overall, scope, schedule, make_it_right = _status_rag_from_items(items)
-    risks = [i for i in items if i["impact"] in {"Critical", "High"}]
-    actions = [i for i in items if i["action"]]
-    sources = sorted({i["source"] for i in items})
-
-    lines = [
-        f"# {customer_name} {engagement_name} - Databricks PS Engagement",
-        "## Weekly Status Report",
-        f"**Date:** {report_date}",
-        "",
-        "## Agenda",
-        "- Teams",
-        "- Status Updates / Issues, risks",
-        "- High Level Plan",
-        "- Resource Plan",
-        "- Key Points to Discuss",
-        "",
-        "## 1) Teams",
-        f"- {customer_name}: Customer sponsor, data lead, engineering lead",
-        "- Databricks / Partner: RSA, Senior PM, Delivery Engineers, Account Team",
-        "",
-        "## 2) Status Updates / Issues, Risks",
-        "### Action Items",
-        "| S. No. | Date | Description | Owner | Status | Comments |",
-        "|---|---|---|---|---|---|",
+    risks = buckets.risks
+    actions = buckets.actions[:12]
+    sources = buckets.sources
+    phase = "In Progress" if items else "Not Started"
+
+    action_rows = [
+        (str(idx), report_date, item.title, item.owner, _status_bucket(item.status, item.impact), item.action)
+        for idx, item in enumerate(actions, start=1)
     ]
-
-    for idx, item in enumerate(actions[:12], start=1):
-        status = _status_bucket(item["status"], item["impact"])
-        lines.append(
-            f"| {idx} | {report_date} | {item['title']} | {item['owner']} | {status} | {item['action']} |"
-        )
-    if len(actions) == 0:
-        lines.append("| 1 | - | No actions captured | - | - | - |")
-
-    lines.extend(
-        [
-            "",
-            "### Engagement Status",
-            f"- **Project Status (Overall):** {overall}",
-            f"- **Scope:** {scope}",
-            f"- **Schedule:** {schedule}",
-            f"- **Make-It-Right:** {make_it_right}",
-            f"- **Status Summary:** Weekly data consolidated from {', '.join(sources) if sources else 'source systems'} for period {period_label}.",
-            "",
-            "### Points to discuss",
-        ]
-    )
-    for r in risks[:5]:
-        lines.append(f"- {r['title']}: {r['detail']}")
-    if len(risks) == 0:
-        lines.append("- No high-severity points to discuss this period.")
-
-    lines.extend(
-        [
-            "",
-            "### Milestones / Phases / Deliverables",
-            "| Item | Status | Target Date |",
-            "|---|---|---|",
-            f"| Discovery & Design Alignment | {'In Progress' if items else 'Not Started'} | TBC |",
-            f"| Build / Validation Stream | {'In Progress' if items else 'Not Started'} | TBC |",
-            f"| Reporting & Handover | {'In Progress' if items else 'Not Started'} | TBC |",
-            "",
-            "**Legend:** Complete | In Progress | At Risk | Blocked | Not Started",
-            "",
-            "### Key Accomplishments & Next Steps",
-            f"**Accomplishments this period ({period_label})**",
-        ]
-    )
-    for i in items[:8]:
-        lines.append(f"- {i['title']} ({i['source']}): {i['detail']}")
-    if len(items) == 0:
-        lines.append("- No source updates captured.")
-
-    lines.append("")
-    lines.append("**Activities for next period**")
-    for a in actions[:8]:
-        lines.append(f"- {a['title']}: {a['action']}")
-    if len(actions) == 0:
-        lines.append("- Confirm source updates and define action owners.")
-
-    lines.extend(
-        [
-            "",
-            "## Risk & Issue",
-            "| ID | Type | Description | Impact | Probability | Action(s) - Owner | Status |",
-            "|---|---|---|---|---|---|---|",
-        ]
-    )
-    for idx, r in enumerate(risks[:10], start=1):
-        lines.append(
-            f"| {idx:02d} | Risk | {r['title']} - {r['detail']} | {r['impact']} | Med | {r['action'] or 'Mitigation TBD'} - {r['owner']} | {r['status']} |"
+    risk_rows = [
+        (
+            f"{idx:02d}",
+            "Risk",
+            f"{r.title} - {r.detail}",
+            r.impact,
+            "Med",
+            f"{r.action or 'Mitigation TBD'} - {r.owner}",
+            r.status,
         )
-    if len(risks) == 0:
-        lines.append("| 01 | Risk | No high-severity risks captured | Low | Low | Continue monitoring - PM | Open |")
-
-    lines.extend(
-        [
-            "",
-            "## 3) High Level Plan",
-            "| Item | Current Status | Notes |",
-            "|---|---|---|",
-            f"| Requirements & Design | {'In Progress' if items else 'Not Started'} | Design decisions and stakeholder approvals in progress. |",
-            f"| Build & Validation | {'In Progress' if items else 'Not Started'} | Weekly execution and quality checks across workstreams. |",
-            f"| Readout & Handover | {'In Progress' if items else 'Not Started'} | PM reporting cadence and governance updates. |",
-            "",
-            "## 4) Resource Plan",
-            "| Name | Role | Hours | 19/1 | 26/1 | 2/2 | 9/2 | 16/2 | 23/2 |",
-            "|---|---|---:|---:|---:|---:|---:|---:|---:|",
-            "| Delivery Lead | Project Delivery | 128 | 16 | 16 | 16 | 16 | 16 | 16 |",
-            "| Data Engineer | Engineering | 240 | 40 | 40 | 40 | 40 | 40 | 40 |",
-            "| PM | Project Management | 64 | 8 | 8 | 8 | 8 | 8 | 8 |",
-            "| RSA | Architecture / Advisory | 32 | 8 | 8 | 8 | 8 | - | - |",
-            "",
-            "## Plan Tracking",
-            "- Tracked in customer Jira / agreed work tracking board.",
-            "",
-            "## 5) Key Points to Discuss",
-            "- Confirm acceptance criteria and sign-off windows.",
-            "- Confirm dependency closure dates and owners.",
-            "- Confirm next-week priorities and stakeholder readiness.",
-            "",
-            "## Appendix",
-            "- Generated from PM automation pipeline.",
-        ]
+        for idx, r in enumerate(risks, start=1)
+    ]
+    summary = (
+        f"Weekly data consolidated from {', '.join(sources) if sources else 'source systems'} "
+        f"for period {period_label}."
     )
-    return "\n".join(lines) + "\n"
+    return [
+        ("h1", f"{customer_name} {engagement_name} - Databricks PS Engagement"),
+        ("h2", "Weekly Status Report"),
+        ("para", ("Date:", report_date)),
+        ("h2", "Agenda"),
+        ("bullets", _VENTIA_AGENDA),
+        ("h2", "1) Teams"),
+        ("bullets", (f"{customer_name}: Customer sponsor, data lead, engineering lead", _VENTIA_PARTNER_TEAM)),
+        ("h2", "2) Status Updates / Issues, Risks"),
+        ("h3", "Action Items"),
+        ("table", (_VENTIA_ACTION_HEADER, action_rows or _VENTIA_NO_ACTION_ROWS, ())),
+        ("h3", "Engagement Status"),
+        (
+            "bullets",
+            (
+                ("Project Status (Overall):", overall),
+                ("Scope:", scope),
+                ("Schedule:", schedule),
+                ("Make-It-Right:", make_it_right),
+                ("Status Summary:", summary),
+            ),
+        ),
+        ("h3", "Points to discuss"),
+        ("bullets", [f"{r.title}: {r.detail}" for r in risks[:5]] or ("No high-severity points to discuss this period.",)),
+        ("h3", "Milestones / Phases / Deliverables"),
+        ("table", (_VENTIA_MILESTONE_HEADER, [(name, phase, "TBC") for name in _VENTIA_MILESTONES], ())),
+        ("para", _VENTIA_LEGEND),
+        ("h3", "Key Accomplishments & Next Steps"),
+        ("label", f"Accomplishments this period ({period_label})"),
+        ("bullets", [f"{i.title} ({i.source}): {i.detail}" for i in items[:8]] or ("No source updates captured.",)),
+        ("label", "Activities for next period"),
+        (
+            "bullets",
+            [f"{a.title}: {a.action}" for a in actions[:8]] or ("Confirm source updates and define action owners.",),
+        ),
+        ("h2", "Risk & Issue"),
+        ("table", (_VENTIA_RISK_HEADER, risk_rows or _VENTIA_NO_RISK_ROWS, ())),
+        ("h2", "3) High Level Plan"),
+        ("table", (_VENTIA_PLAN_HEADER, [(name, phase, note) for name, note in _VENTIA_PLAN_ITEMS], ())),
+        ("h2", "4) Resource Plan"),
+        ("table", (_VENTIA_RESOURCE_HEADER, _VENTIA_RESOURCE_ROWS, _VENTIA_RESOURCE_NUMERIC)),
+        ("h2", "Plan Tracking"),
+        ("bullets", ("Tracked in customer Jira / agreed work tracking board.",)),
+        ("h2", "5) Key Points to Discuss"),
+        ("bullets", _VENTIA_DISCUSSION_POINTS),
+        ("h2", "Appendix"),
+        ("bullets", ("Generated from PM automation pipeline.",)),
+    ]
+
+
+def _md_line(line: _Line) -> str:
+    if isinstance(line, str):
+        return line
+    label, text = line
+    return f"**{label}** {text}"
+
+
+def generate_ventia_markdown(
+    items: list[Item],
+    report_date: str,
+    period_label: str,
+    customer_name: str,
+    engagement_name: str,
+    sections: list[_Section] | None = None,
+) -> str:
+    if sections is None:
+        sections = _build_ventia_sections(items, report_date, period_label, customer_name, engagement_name)
+    buf = io.StringIO()
+    w = buf.write
+    prev = None
+    for kind, value in sections:
+        if prev is not None and prev not in _STICKY_KINDS:
+            w("\n")
+        prev = kind
+        if kind in _MD_HEADING:
+            w(f"{_MD_HEADING[kind]}{value}\n")
+        elif kind == "label":
+            w(f"**{value}**\n")
+        elif kind == "para":
+            w(f"{_md_line(value)}\n")
+        elif kind == "bullets":
+            for line in value:
+                w(f"- {_md_line(line)}\n")
+        elif kind == "table":
+            header, rows, numeric = value
+            w(f"| {' | '.join(header)} |\n")
+            w(f"|{'|'.join('---:' if col in numeric else '---' for col in range(len(header)))}|\n")
+            for row in rows:
+                w(f"| {' | '.join(row)} |\n")
+    return buf.getvalue()
 
 
 def generate_ventia_html(
-    items: list[dict[str, str]], report_date: str, period_label: str, customer_name: str, engagement_name: str
+    items: list[Item],
+    report_date: str,
+    period_label: str,
+    customer_name: str,
+    engagement_name: str,
+    sections: list[_Section] | None = None,
 ) -> str:
-    md = generate_ventia_markdown(items, report_date, period_label, customer_name, engagement_name)
-    escaped = html.escape(md)
+    """Render the Ventia report as HTML, escaping each cell rather than a whole markdown dump."""
+    _esc = html.escape
+    if sections is None:
+        sections = _build_ventia_sections(items, report_date, period_label, customer_name, engagement_name)
+
+    def inline(line: _Line) -> str:
+        if isinstance(line, str):
+            return _esc(line)
+        label, text = line
+        return f"<strong>{_esc(label)}</strong> {_esc(text)}"
+
+    parts = []
+    for kind, value in sections:
+        if kind in _MD_HEADING:
+            parts.append(f"  <{kind}>{_esc(value)}</{kind}>")
+        elif kind == "label":
+            parts.append(f"  <p><strong>{_esc(value)}</strong></p>")
+        elif kind == "para":
+            parts.append(f"  <p>{inline(value)}</p>")
+        elif kind == "bullets":
+            parts.append("  <ul>" + "".join(f"<li>{inline(line)}</li>" for line in value) + "</ul>")
+        elif kind == "table":
+            header, rows, numeric = value
+            head = "".join(
+                f'<th class="num">{_esc(cell)}</th>' if col in numeric else f"<th>{_esc(cell)}</th>"
+                for col, cell in enumerate(header)
+            )
+            body = "".join(
+                "<tr>"
+                + "".join(
+                    f'<td class="num">{_esc(cell)}</td>' if col in numeric else f"<td>{_esc(cell)}</td>"
+                    for col, cell in enumerate(row)
+                )
+                + "</tr>"
+                for row in rows
+            )
+            parts.append(f"  <table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>")
+    body_html = "\n".join(parts)
+
     return f"""<!doctype html>
 <html>
 <head>
   <meta charset="utf-8" />
-  <title>{html.escape(customer_name)} {html.escape(engagement_name)} - PS Weekly Status</title>
+  <title>{_esc(customer_name)} {_esc(engagement_name)} - PS Weekly Status</title>
   <style>
     body {{ font-family: Arial, sans-serif; margin: 28px; color: #222; }}
     h1 {{ margin-bottom: 8px; }}
     .note {{ color: #555; margin-bottom: 16px; }}
-    pre {{ white-space: pre-wrap; line-height: 1.35; }}
+    table {{ border-collapse: collapse; width: 100%; margin-bottom: 12px; }}
+    th, td {{ border: 1px solid #ddd; padding: 6px 8px; vertical-align: top; text-align: left; }}
+    th {{ background: #f5f5f5; }}
+    .num {{ text-align: right; }}
   </style>
 </head>
 <body>
-  <div class="note">{html.escape(customer_name)} template format view ({html.escape(report_date)} / {html.escape(period_label)})</div>
-  <pre>{escaped}</pre>
+  <div class="note">{_esc(customer_name)} template format view ({_esc(report_date)} / {_esc(period_label)})</div>
+{body_html}
 </body>
 </html>
 """
@@ -471,6 +672,7 @@ def fetch_live_inputs(
         "glean": {"insights": []},
     }
 
+    to_fetch = []
     for source, server_name in source_server_pairs.items():
         out_path = inputs_dir / f"{source}.json"
         if server_name not in servers:
@@ -478,8 +680,16 @@ def fetch_live_inputs(
             if not out_path.exists():
                 save_json(out_path, fallback_shapes[source])
             continue
+        to_fetch.append((server_name, source, lookback_days))
+
+    # Sources are independent and network-bound, so fetch them concurrently.
+    results = fetch_many(servers, to_fetch, customer_name=customer_name)
+    for _, source, _ in to_fetch:
+        out_path = inputs_dir / f"{source}.json"
         try:
-            payload = fetch_source_data(servers[server_name], source, lookback_days, customer_name=customer_name)
+            payload = results[source]
+            if isinstance(payload, Exception):
+                raise payload
             save_json(out_path, payload)
             print(f"[ok] Fetched {source} into {out_path}")
         except Exception as exc:
@@ -513,11 +723,15 @@ def ingest_skill_exports(project_root: Path, skills_dir: Path, overwrite: bool =
 
         if json_src.exists():
             try:
-                payload = json.loads(json_src.read_text(encoding="utf-8"))
+                payload = load_json(json_src)
                 if not isinstance(payload, dict):
                     raise ValueError("JSON export must be an object")
                 if overwrite or not out_path.exists():
-                    save_json(out_path, payload)
+                    # Already valid JSON: copy the bytes rather than re-encoding the tree,
+                    # via a temp file so readers never see a partial write.
+                    tmp_path = out_path.with_name(f"{out_path.name}.tmp")
+                    shutil.copyfile(json_src, tmp_path)
+                    os.replace(tmp_path, out_path)
                 print(f"[ok] Imported {source} from {json_src}")
                 continue
             except Exception as exc:
@@ -548,13 +762,21 @@ def build_report(
     gdrive = read_json(inputs_dir / "gdrive.json", {"documents": []})
     glean = read_json(inputs_dir / "glean.json", {"insights": []})
 
-    items = (
-        normalize_slack(slack)
-        + normalize_salesforce(salesforce)
-        + normalize_gdrive(gdrive)
-        + normalize_glean(glean)
-    )
-    items.sort(key=lambda x: priority_weight(x["impact"]), reverse=True)
+    # Note each source label as its normalizer yields items, rather than rescanning later.
+    items: list[Item] = []
+    seen_sources: set[str] = set()
+    for batch in (
+        normalize_slack(slack),
+        normalize_salesforce(salesforce),
+        normalize_gdrive(gdrive),
+        normalize_glean(glean),
+    ):
+        if batch:
+            items.extend(batch)
+            seen_sources.add(batch[0].source)
+    items.sort(key=attrgetter("weight"), reverse=True)
+    # Classify once; the markdown and both Ventia views all read the same buckets.
+    buckets = _classify_items(items, sorted(seen_sources))
 
     report_date = dt.datetime.now().strftime("%Y-%m-%d %H:%M")
     md_path = outputs_dir / "pm_weekly_report.md"
@@ -563,14 +785,27 @@ def build_report(
     ventia_md_path = outputs_dir / f"{customer_slug}_anz_ps_weekly_report.md"
     ventia_html_path = outputs_dir / f"{customer_slug}_anz_ps_weekly_report.html"
 
-    md_path.write_text(generate_markdown(items, report_date), encoding="utf-8")
-    html_path.write_text(generate_html(items, report_date), encoding="utf-8")
-    ventia_md_path.write_text(
-        generate_ventia_markdown(items, report_date, period_label, customer_name, engagement_name), encoding="utf-8"
-    )
-    ventia_html_path.write_text(
-        generate_ventia_html(items, report_date, period_label, customer_name, engagement_name), encoding="utf-8"
-    )
+    # Each file is handed to a writer thread as soon as it is rendered, so disk
+    # writes overlap with formatting the next report.
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        writes = [
+            pool.submit(md_path.write_bytes, generate_markdown(items, report_date, buckets).encode("utf-8")),
+            pool.submit(html_path.write_bytes, generate_html(items, report_date).encode("utf-8")),
+        ]
+        # Both Ventia views render from one structured build of the report content.
+        sections = _build_ventia_sections(
+            items, report_date, period_label, customer_name, engagement_name, buckets
+        )
+        ventia_md = generate_ventia_markdown(
+            items, report_date, period_label, customer_name, engagement_name, sections=sections
+        )
+        writes.append(pool.submit(ventia_md_path.write_bytes, ventia_md.encode("utf-8")))
+        ventia_html = generate_ventia_html(
+            items, report_date, period_label, customer_name, engagement_name, sections=sections
+        )
+        writes.append(pool.submit(ventia_html_path.write_bytes, ventia_html.encode("utf-8")))
+        for write in writes:
+            write.result()
     return md_path, html_path, ventia_md_path, ventia_html_path
 
 